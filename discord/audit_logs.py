@@ -25,7 +25,8 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generator, TypeVar
+import types
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generator, Mapping, TypeVar
 
 from . import enums, utils
 from .asset import Asset
@@ -56,6 +57,7 @@ if TYPE_CHECKING:
     from .state import ConnectionState
     from .sticker import GuildSticker
     from .threads import Thread
+    from .types.audit_log import AuditEntryInfo
     from .types.audit_log import AuditLogChange as AuditLogChangePayload
     from .types.audit_log import AuditLogEntry as AuditLogEntryPayload
     from .types.automod import AutoModAction as AutoModActionPayload
@@ -91,7 +93,8 @@ def _transform_channels(
 ) -> list[abc.GuildChannel | Object] | None:
     if data is None:
         return None
-    return [_transform_channel(entry, channel) for channel in data]
+    get_channel = entry.guild.get_channel
+    return [get_channel(c := int(channel)) or Object(id=c) for channel in data]
 
 
 def _transform_roles(
@@ -99,7 +102,8 @@ def _transform_roles(
 ) -> list[Role | Object] | None:
     if data is None:
         return None
-    return [entry.guild.get_role(int(r)) or Object(id=r) for r in data]
+    get_role = entry.guild.get_role
+    return [get_role(r := int(role)) or Object(id=r) for role in data]
 
 
 def _transform_member_id(
@@ -119,24 +123,27 @@ def _transform_guild_id(entry: AuditLogEntry, data: Snowflake | None) -> Guild |
 def _transform_overwrites(
     entry: AuditLogEntry, data: list[PermissionOverwritePayload]
 ) -> list[tuple[Object, PermissionOverwrite]]:
+    get_role = entry.guild.get_role
+    get_member = entry._get_member
+    from_pair = PermissionOverwrite.from_pair
     overwrites = []
+    append = overwrites.append
     for elem in data:
-        allow = Permissions(int(elem["allow"]))
-        deny = Permissions(int(elem["deny"]))
-        ow = PermissionOverwrite.from_pair(allow, deny)
+        ow = from_pair(Permissions(int(elem["allow"])), Permissions(int(elem["deny"])))
 
         ow_type = elem["type"]
         ow_id = int(elem["id"])
-        target = None
         if ow_type == 0:
-            target = entry.guild.get_role(ow_id)
+            target = get_role(ow_id)
         elif ow_type == 1:
-            target = entry._get_member(ow_id)
+            target = get_member(ow_id)
+        else:
+            target = None
 
         if target is None:
             target = Object(id=ow_id)
 
-        overwrites.append((target, ow))
+        append((target, ow))
 
     return overwrites
 
@@ -176,16 +183,33 @@ T = TypeVar("T", bound=enums.Enum)
 
 
 def _enum_transformer(enum: type[T]) -> Callable[[AuditLogEntry, int], T]:
+    lookup = enum._enum_value_map_.get  # type: ignore
+    try_enum = enums.try_enum
+
     def _transform(entry: AuditLogEntry, data: int) -> T:
-        return enums.try_enum(enum, data)
+        try:
+            value = lookup(data)
+        except TypeError:
+            # unhashable, try_enum turns it into an unknown value
+            value = None
+        if value is None:
+            return try_enum(enum, data)
+        return value
 
     return _transform
 
 
+_STICKER_ACTIONS = frozenset(
+    name
+    for name in enums.AuditLogAction._enum_member_names_  # type: ignore
+    if name.startswith("sticker_")
+)
+
+
 def _transform_type(
     entry: AuditLogEntry, data: int
 ) -> enums.ChannelType | enums.StickerType:
-    if entry.action.name.startswith("sticker_"):
+    if entry.action.name in _STICKER_ACTIONS:
         return enums.try_enum(enums.StickerType, data)
     else:
         return enums.try_enum(enums.ChannelType, data)
@@ -229,9 +253,16 @@ class AuditLogDiff:
 
 Transformer = Callable[["AuditLogEntry", Any], Any]
 
+_ADD_TRIGGER_KEYS = frozenset(
+    ("$add_keyword_filter", "$add_regex_patterns", "$add_allow_list")
+)
+_REMOVE_TRIGGER_KEYS = frozenset(
+    ("$remove_keyword_filter", "$remove_regex_patterns", "$remove_allow_list")
+)
+
 
 class AuditLogChanges:
-    TRANSFORMERS: ClassVar[dict[str, tuple[str | None, Transformer | None]]] = {
+    TRANSFORMERS: ClassVar[Mapping[str, tuple[str | None, Transformer | None]]] = {
         "verification_level": (None, _enum_transformer(enums.VerificationLevel)),
         "explicit_content_filter": (None, _enum_transformer(enums.ContentFilter)),
         "allow": (None, _transform_permissions),
@@ -282,6 +313,19 @@ class AuditLogChanges:
         "exempt_roles": (None, _transform_roles),
         "exempt_channels": (None, _transform_channels),
     }
+    # __init__ looks changes up in these flattened maps, which are built from
+    # TRANSFORMERS once when the class is created
+    _RENAME: ClassVar[dict[str, str]] = {
+        key: rename for key, (rename, _) in TRANSFORMERS.items() if rename
+    }
+    _TRANSFORM: ClassVar[dict[str, Transformer]] = {
+        key: transformer
+        for key, (_, transformer) in TRANSFORMERS.items()
+        if transformer
+    }
+    # later changes to TRANSFORMERS wouldn't be picked up by the maps above,
+    # so it's made read-only to have them fail loudly instead
+    TRANSFORMERS = types.MappingProxyType(TRANSFORMERS)
 
     def __init__(
         self,
@@ -293,98 +337,108 @@ class AuditLogChanges:
         self.before = AuditLogDiff()
         self.after = AuditLogDiff()
 
-        for elem in sorted(data, key=lambda i: i["key"]):
+        # plenty of entries (e.g. deletions) have no changes at all
+        if not data:
+            return
+
+        # only the order of the $ keys and of location matters. The $ keys are
+        # handled first and in key order, so the last one alphabetically still
+        # wins as it did when every change was sorted. location goes last as
+        # it relies on location_type and channel being set already
+        dollar = []
+        rest = []
+        locations = []
+        for elem in data:
+            key = elem["key"]
+            if key == "location":
+                locations.append(elem)
+            elif key.startswith("$"):
+                dollar.append(elem)
+            else:
+                rest.append(elem)
+
+        if len(dollar) > 1:
+            dollar.sort(key=lambda i: i["key"])
+
+        if locations:
+            # imported once here rather than per change, a module level
+            # import would be circular
+            from .scheduled_events import ScheduledEventLocation
+
+        changes = dollar + rest + locations
+
+        # everything the loop touches is kept in locals, this is the hot path
+        # when paging through large audit logs
+        before_diff = self.before
+        after_diff = self.after
+        rename = self._RENAME
+        transformers = self._TRANSFORM
+
+        for elem in changes:
             attr = elem["key"]
 
             # special cases for role/trigger_metadata add/remove
             if attr == "$add":
-                self._handle_role(self.before, self.after, entry, elem["new_value"])  # type: ignore
+                self._handle_role(before_diff, after_diff, entry, elem["new_value"])  # type: ignore
                 continue
             elif attr == "$remove":
-                self._handle_role(self.after, self.before, entry, elem["new_value"])  # type: ignore
+                self._handle_role(after_diff, before_diff, entry, elem["new_value"])  # type: ignore
                 continue
-            elif attr in [
-                "$add_keyword_filter",
-                "$add_regex_patterns",
-                "$add_allow_list",
-            ]:
+            elif attr in _ADD_TRIGGER_KEYS:
                 self._handle_trigger_metadata(
-                    self.before, self.after, entry, elem["new_value"], attr
+                    before_diff, after_diff, entry, elem["new_value"], attr
                 )
                 continue
-            elif attr in [
-                "$remove_keyword_filter",
-                "$remove_regex_patterns",
-                "$remove_allow_list",
-            ]:
+            elif attr in _REMOVE_TRIGGER_KEYS:
                 self._handle_trigger_metadata(
-                    self.after, self.before, entry, elem["new_value"], attr
+                    after_diff, before_diff, entry, elem["new_value"], attr
                 )
                 continue
 
-            try:
-                key, transformer = self.TRANSFORMERS[attr]
-            except (ValueError, KeyError):
-                transformer = None
-            else:
-                if key:
-                    attr = key
+            transformer = transformers.get(attr)
+            attr = rename.get(attr, attr)
 
-            transformer: Transformer | None
-
-            try:
-                before = elem["old_value"]
-            except KeyError:
-                before = None
-            else:
-                if transformer:
-                    before = transformer(entry, before)
-
-            if attr == "location" and hasattr(self.before, "location_type"):
-                from .scheduled_events import ScheduledEventLocation
+            before = elem.get("old_value")
+            if before is not None and transformer:
+                before = transformer(entry, before)
 
+            if attr == "location" and "location_type" in before_diff.__dict__:
                 if (
-                    self.before.location_type
+                    before_diff.location_type
                     is enums.ScheduledEventLocationType.external
                 ):
                     before = ScheduledEventLocation(state=state, value=before)
-                elif hasattr(self.before, "channel"):
+                elif "channel" in before_diff.__dict__:
                     before = ScheduledEventLocation(
-                        state=state, value=self.before.channel
+                        state=state, value=before_diff.channel
                     )
 
-            setattr(self.before, attr, before)
-
-            try:
-                after = elem["new_value"]
-            except KeyError:
-                after = None
-            else:
-                if transformer:
-                    after = transformer(entry, after)
+            setattr(before_diff, attr, before)
 
-            if attr == "location" and hasattr(self.after, "location_type"):
-                from .scheduled_events import ScheduledEventLocation
+            after = elem.get("new_value")
+            if after is not None and transformer:
+                after = transformer(entry, after)
 
+            if attr == "location" and "location_type" in after_diff.__dict__:
                 if (
-                    self.after.location_type
+                    after_diff.location_type
                     is enums.ScheduledEventLocationType.external
                 ):
                     after = ScheduledEventLocation(state=state, value=after)
-                elif hasattr(self.after, "channel"):
+                elif "channel" in after_diff.__dict__:
                     after = ScheduledEventLocation(
-                        state=state, value=self.after.channel
+                        state=state, value=after_diff.channel
                     )
 
-            setattr(self.after, attr, after)
+            setattr(after_diff, attr, after)
 
         # add an alias
-        if hasattr(self.after, "colour"):
-            self.after.color = self.after.colour
-            self.before.color = self.before.colour
-        if hasattr(self.after, "expire_behavior"):
-            self.after.expire_behaviour = self.after.expire_behavior
-            self.before.expire_behaviour = self.before.expire_behavior
+        if "colour" in after_diff.__dict__:
+            after_diff.color = after_diff.colour
+            before_diff.color = before_diff.colour
+        if "expire_behavior" in after_diff.__dict__:
+            after_diff.expire_behaviour = after_diff.expire_behavior
+            before_diff.expire_behaviour = before_diff.expire_behavior
 
     def __repr__(self) -> str:
         return f"<AuditLogChanges before={self.before!r} after={self.after!r}>"
@@ -396,7 +450,7 @@ class AuditLogChanges:
         entry: AuditLogEntry,
         elem: list[RolePayload],
     ) -> None:
-        if not hasattr(first, "roles"):
+        if "roles" not in first.__dict__:
             setattr(first, "roles", [])
 
         data = []
@@ -422,7 +476,7 @@ class AuditLogChanges:
         elem: list[AutoModTriggerMetadataPayload],
         attr: str,
     ) -> None:
-        if not hasattr(first, "trigger_metadata"):
+        if "trigger_metadata" not in first.__dict__:
             setattr(first, "trigger_metadata", None)
 
         key = attr.split("_", 1)[-1]
@@ -433,27 +487,139 @@ class AuditLogChanges:
 
 
 class _AuditLogProxyMemberPrune:
+    __slots__ = ("delete_member_days", "members_removed")
+
     delete_member_days: int
     members_removed: int
 
+    def __init__(self, data: AuditEntryInfo) -> None:
+        for attr in self.__slots__:
+            if attr in data:
+                setattr(self, attr, int(data[attr]))
+
 
 class _AuditLogProxyMemberMoveOrMessageDelete:
+    __slots__ = ("channel", "count")
+
     channel: abc.GuildChannel
     count: int
 
+    def __init__(self, channel: abc.GuildChannel, count: int) -> None:
+        self.channel = channel
+        self.count = count
+
 
 class _AuditLogProxyMemberDisconnect:
+    __slots__ = ("count",)
+
     count: int
 
+    def __init__(self, count: int) -> None:
+        self.count = count
+
 
 class _AuditLogProxyPinAction:
+    __slots__ = ("channel", "message_id")
+
     channel: abc.GuildChannel
     message_id: int
 
+    def __init__(self, channel: abc.GuildChannel, message_id: int) -> None:
+        self.channel = channel
+        self.message_id = message_id
+
 
 class _AuditLogProxyStageInstanceAction:
+    __slots__ = ("channel",)
+
     channel: abc.GuildChannel
 
+    def __init__(self, channel: abc.GuildChannel) -> None:
+        self.channel = channel
+
+
+def _extra_member_prune(
+    entry: AuditLogEntry, extra: AuditEntryInfo
+) -> _AuditLogProxyMemberPrune:
+    # member prune has two keys with useful information
+    return _AuditLogProxyMemberPrune(extra)
+
+
+def _extra_member_move_or_message_delete(
+    entry: AuditLogEntry, extra: AuditEntryInfo
+) -> _AuditLogProxyMemberMoveOrMessageDelete:
+    channel_id = int(extra["channel_id"])
+    return _AuditLogProxyMemberMoveOrMessageDelete(
+        channel=entry.guild.get_channel(channel_id) or Object(id=channel_id),
+        count=int(extra["count"]),
+    )
+
+
+def _extra_member_disconnect(
+    entry: AuditLogEntry, extra: AuditEntryInfo
+) -> _AuditLogProxyMemberDisconnect:
+    # The member disconnect action has a dict with some information
+    return _AuditLogProxyMemberDisconnect(count=int(extra["count"]))
+
+
+def _extra_pin(entry: AuditLogEntry, extra: AuditEntryInfo) -> _AuditLogProxyPinAction:
+    # the pin actions have a dict with some information
+    channel_id = int(extra["channel_id"])
+    return _AuditLogProxyPinAction(
+        channel=entry.guild.get_channel(channel_id) or Object(id=channel_id),
+        message_id=int(extra["message_id"]),
+    )
+
+
+def _extra_overwrite(
+    entry: AuditLogEntry, extra: AuditEntryInfo
+) -> Member | User | Role | Object | AuditEntryInfo | None:
+    # the overwrite_ actions have a dict with some information
+    instance_id = int(extra["id"])
+    the_type = extra.get("type")
+    if the_type == "1":
+        return entry._get_member(instance_id)
+    elif the_type == "0":
+        role = entry.guild.get_role(instance_id)
+        if role is None:
+            role = Object(id=instance_id)
+            role.name = extra.get("role_name")  # type: ignore
+        return role
+    return extra
+
+
+def _extra_stage_instance(
+    entry: AuditLogEntry, extra: AuditEntryInfo
+) -> _AuditLogProxyStageInstanceAction:
+    channel_id = int(extra["channel_id"])
+    return _AuditLogProxyStageInstanceAction(
+        channel=entry.guild.get_channel(channel_id) or Object(id=channel_id)
+    )
+
+
+# keyed by action name rather than by action, unknown actions may wrap values
+# that can't be hashed but their name is always a string
+_EXTRA_HANDLERS: dict[str, Transformer] = {
+    "member_prune": _extra_member_prune,
+    "member_move": _extra_member_move_or_message_delete,
+    "message_delete": _extra_member_move_or_message_delete,
+    "member_disconnect": _extra_member_disconnect,
+}
+
+# the remaining handlers apply to a whole family of actions, these are resolved
+# to the individual actions up front so that _from_data only does a dict lookup
+for _name in enums.AuditLogAction._enum_member_names_:  # type: ignore
+    if _name.endswith("pin"):
+        _EXTRA_HANDLERS[_name] = _extra_pin
+    elif _name.startswith("overwrite_"):
+        _EXTRA_HANDLERS[_name] = _extra_overwrite
+    elif _name.startswith("stage_instance"):
+        _EXTRA_HANDLERS[_name] = _extra_stage_instance
+
+del _name
+
+_ACTION_LOOKUP: dict[int, enums.AuditLogAction] = enums.AuditLogAction._enum_value_map_  # type: ignore
+
 
 class AuditLogEntry(Hashable):
     r"""Represents an Audit Log entry.
@@ -498,6 +664,26 @@ class AuditLogEntry(Hashable):
         which actions have this field filled out.
     """
 
+    __slots__ = (
+        "_state",
+        "guild",
+        "_users",
+        "action",
+        "id",
+        "reason",
+        "extra",
+        "user",
+        "_target_id",
+        "_changes",
+        "_cs_created_at",
+        "_cs_target",
+        "_cs_category",
+        "_cs_changes",
+        "_cs_before",
+        "_cs_after",
+        "__weakref__",
+    )
+
     def __init__(
         self, *, users: dict[int, User], data: AuditLogEntryPayload, guild: Guild
     ):
@@ -507,72 +693,20 @@ class AuditLogEntry(Hashable):
         self._from_data(data)
 
     def _from_data(self, data: AuditLogEntryPayload) -> None:
-        self.action = enums.try_enum(enums.AuditLogAction, data["action_type"])
+        action_type = data["action_type"]
+        try:
+            self.action = _ACTION_LOOKUP[action_type]
+        except (KeyError, TypeError):
+            self.action = enums.try_enum(enums.AuditLogAction, action_type)
         self.id = int(data["id"])
 
         # this key is technically not usually present
         self.reason = data.get("reason")
         self.extra = data.get("options")
 
-        if isinstance(self.action, enums.AuditLogAction) and self.extra:
-            if self.action is enums.AuditLogAction.member_prune:
-                # member prune has two keys with useful information
-                self.extra: _AuditLogProxyMemberPrune = type(
-                    "_AuditLogProxy", (), {k: int(v) for k, v in self.extra.items()}
-                )()
-            elif (
-                self.action is enums.AuditLogAction.member_move
-                or self.action is enums.AuditLogAction.message_delete
-            ):
-                channel_id = int(self.extra["channel_id"])
-                elems = {
-                    "count": int(self.extra["count"]),
-                    "channel": self.guild.get_channel(channel_id)
-                    or Object(id=channel_id),
-                }
-                self.extra: _AuditLogProxyMemberMoveOrMessageDelete = type(
-                    "_AuditLogProxy", (), elems
-                )()
-            elif self.action is enums.AuditLogAction.member_disconnect:
-                # The member disconnect action has a dict with some information
-                elems = {
-                    "count": int(self.extra["count"]),
-                }
-                self.extra: _AuditLogProxyMemberDisconnect = type(
-                    "_AuditLogProxy", (), elems
-                )()
-            elif self.action.name.endswith("pin"):
-                # the pin actions have a dict with some information
-                channel_id = int(self.extra["channel_id"])
-                elems = {
-                    "channel": self.guild.get_channel(channel_id)
-                    or Object(id=channel_id),
-                    "message_id": int(self.extra["message_id"]),
-                }
-                self.extra: _AuditLogProxyPinAction = type(
-                    "_AuditLogProxy", (), elems
-                )()
-            elif self.action.name.startswith("overwrite_"):
-                # the overwrite_ actions have a dict with some information
-                instance_id = int(self.extra["id"])
-                the_type = self.extra.get("type")
-                if the_type == "1":
-                    self.extra = self._get_member(instance_id)
-                elif the_type == "0":
-                    role = self.guild.get_role(instance_id)
-                    if role is None:
-                        role = Object(id=instance_id)
-                        role.name = self.extra.get("role_name")  # type: ignore
-                    self.extra: Role = role
-            elif self.action.name.startswith("stage_instance"):
-                channel_id = int(self.extra["channel_id"])
-                elems = {
-                    "channel": self.guild.get_channel(channel_id)
-                    or Object(id=channel_id)
-                }
-                self.extra: _AuditLogProxyStageInstanceAction = type(
-                    "_AuditLogProxy", (), elems
-                )()
+        handler = _EXTRA_HANDLERS.get(self.action.name)
+        if handler is not None and self.extra:
+            self.extra = handler(self, self.extra)
 
         self.extra: (
             _AuditLogProxyMemberPrune
@@ -593,8 +727,10 @@ class AuditLogEntry(Hashable):
         # into meaningful data when requested
         self._changes = data.get("changes", [])
 
-        self.user = self._get_member(utils._get_as_snowflake(data, "user_id"))  # type: ignore
-        self._target_id = utils._get_as_snowflake(data, "target_id")
+        user_id = data.get("user_id")
+        self.user = self._get_member(int(user_id)) if user_id else None
+        target_id = data.get("target_id")
+        self._target_id = int(target_id) if target_id else None
 
     def _get_member(self, user_id: int) -> Member | User | None:
         return self.guild.get_member(user_id) or self._users.get(user_id)
@@ -602,12 +738,12 @@ class AuditLogEntry(Hashable):
     def __repr__(self) -> str:
         return f"<AuditLogEntry id={self.id} action={self.action} user={self.user!r}>"
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_created_at")
     def created_at(self) -> datetime.datetime:
         """Returns the entry's creation time in UTC."""
         return utils.snowflake_time(self.id)
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_target")
     def target(
         self,
     ) -> (
@@ -631,24 +767,24 @@ class AuditLogEntry(Hashable):
         else:
             return converter(self._target_id)
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_category")
     def category(self) -> enums.AuditLogActionCategory:
         """The category of the action, if applicable."""
         return self.action.category
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_changes")
     def changes(self) -> AuditLogChanges:
         """The list of changes this entry has."""
         obj = AuditLogChanges(self, self._changes, state=self._state)
         del self._changes
         return obj
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_before")
     def before(self) -> AuditLogDiff:
         """The target's prior state."""
         return self.changes.before
 
-    @utils.cached_property
+    @utils.cached_slot_property("_cs_after")
     def after(self) -> AuditLogDiff:
         """The target's subsequent state."""
         return self.changes.after
@@ -0,0 +1,257 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import pytest
+
+from discord.audit_logs import AuditLogEntry
+from discord.enums import (
+    AuditLogAction,
+    ScheduledEventLocationType,
+    StickerType,
+    VerificationLevel,
+)
+from discord.object import Object
+
+
+class StubState:
+    def _get_guild(self, guild_id):
+        return None
+
+
+class StubGuild:
+    id = 1
+
+    def __init__(self, roles=None, channels=None, members=None):
+        self._state = StubState()
+        self._roles = roles or {}
+        self._channels = channels or {}
+        self._members = members or {}
+
+    def get_role(self, role_id):
+        return self._roles.get(role_id)
+
+    def get_channel(self, channel_id):
+        return self._channels.get(channel_id)
+
+    def get_member(self, user_id):
+        return self._members.get(user_id)
+
+
+def make_entry(guild=None, users=None, **data):
+    payload = {"id": "123456789012345678", "user_id": "5", "target_id": "7"}
+    payload.update(data)
+    return AuditLogEntry(users=users or {}, data=payload, guild=guild or StubGuild())
+
+
+def test_extra_member_prune():
+    entry = make_entry(
+        action_type=AuditLogAction.member_prune.value,
+        options={"delete_member_days": "7", "members_removed": "3"},
+    )
+    assert entry.extra.delete_member_days == 7
+    assert entry.extra.members_removed == 3
+
+
+@pytest.mark.parametrize(
+    "action", [AuditLogAction.member_move, AuditLogAction.message_delete]
+)
+def test_extra_member_move_or_message_delete(action):
+    channel = object()
+    entry = make_entry(
+        guild=StubGuild(channels={11: channel}),
+        action_type=action.value,
+        options={"channel_id": "11", "count": "2"},
+    )
+    assert entry.extra.channel is channel
+    assert entry.extra.count == 2
+
+
+def test_extra_member_disconnect():
+    entry = make_entry(
+        action_type=AuditLogAction.member_disconnect.value, options={"count": "4"}
+    )
+    assert entry.extra.count == 4
+
+
+@pytest.mark.parametrize(
+    "action", [AuditLogAction.message_pin, AuditLogAction.message_unpin]
+)
+def test_extra_pin(action):
+    entry = make_entry(
+        action_type=action.value, options={"channel_id": "11", "message_id": "12"}
+    )
+    assert isinstance(entry.extra.channel, Object)
+    assert entry.extra.channel.id == 11
+    assert entry.extra.message_id == 12
+
+
+def test_extra_overwrite_role():
+    role = object()
+    entry = make_entry(
+        guild=StubGuild(roles={11: role}),
+        action_type=AuditLogAction.overwrite_create.value,
+        options={"id": "11", "type": "0", "role_name": "mods"},
+    )
+    assert entry.extra is role
+
+
+def test_extra_overwrite_missing_role():
+    entry = make_entry(
+        action_type=AuditLogAction.overwrite_update.value,
+        options={"id": "11", "type": "0", "role_name": "mods"},
+    )
+    assert isinstance(entry.extra, Object)
+    assert entry.extra.id == 11
+    assert entry.extra.name == "mods"
+
+
+def test_extra_overwrite_member():
+    user = object()
+    entry = make_entry(
+        users={11: user},
+        action_type=AuditLogAction.overwrite_delete.value,
+        options={"id": "11", "type": "1"},
+    )
+    assert entry.extra is user
+
+
+def test_extra_overwrite_other_type():
+    options = {"id": "11", "type": "2"}
+    entry = make_entry(
+        action_type=AuditLogAction.overwrite_create.value, options=options
+    )
+    assert entry.extra == options
+
+
+def test_extra_stage_instance():
+    entry = make_entry(
+        action_type=AuditLogAction.stage_instance_create.value,
+        options={"channel_id": "11"},
+    )
+    assert entry.extra.channel.id == 11
+
+
+def test_unknown_action_type():
+    options = {"count": "1"}
+    entry = make_entry(action_type=9999, options=options)
+    assert entry.action.value == 9999
+    assert entry.extra == options
+
+
+def test_unhashable_action_type():
+    entry = make_entry(
+        action_type=[1],
+        options={"count": "1"},
+        changes=[{"key": "type", "new_value": 1}],
+    )
+    assert entry.action.value == [1]
+    assert entry.extra == {"count": "1"}
+    assert entry.after.type.value == 1
+
+
+def test_sticker_type():
+    entry = make_entry(
+        action_type=AuditLogAction.sticker_create.value,
+        changes=[{"key": "type", "new_value": 1}],
+    )
+    assert entry.after.type is StickerType.standard
+
+
+def test_enum_values():
+    entry = make_entry(
+        action_type=AuditLogAction.guild_update.value,
+        changes=[
+            {"key": "verification_level", "old_value": [1], "new_value": 2},
+            {"key": "explicit_content_filter", "old_value": 0, "new_value": 99},
+        ],
+    )
+    assert entry.before.verification_level.value == [1]
+    assert entry.after.verification_level is VerificationLevel.medium
+    assert entry.after.explicit_content_filter.value == 99
+
+
+def test_location_external():
+    entry = make_entry(
+        action_type=AuditLogAction.scheduled_event_create.value,
+        changes=[
+            {"key": "location", "new_value": "somewhere"},
+            {"key": "entity_type", "new_value": 3},
+        ],
+    )
+    assert entry.after.location_type is ScheduledEventLocationType.external
+    assert entry.after.location.value == "somewhere"
+
+
+def test_location_from_channel():
+    channel = object()
+    entry = make_entry(
+        guild=StubGuild(channels={11: channel}),
+        action_type=AuditLogAction.scheduled_event_update.value,
+        changes=[
+            {"key": "location", "old_value": None, "new_value": None},
+            {"key": "channel_id", "old_value": None, "new_value": "11"},
+            {"key": "entity_type", "old_value": 1, "new_value": 2},
+        ],
+    )
+    assert entry.after.location.value is channel
+    assert entry.before.location.value is None
+
+
+def test_trigger_metadata_key_order():
+    entry = make_entry(
+        action_type=AuditLogAction.auto_moderation_rule_update.value,
+        changes=[
+            {"key": "$add_regex_patterns", "new_value": ["a"]},
+            {"key": "$add_keyword_filter", "new_value": ["k"]},
+        ],
+    )
+    assert entry.before.trigger_metadata is None
+    assert entry.after.trigger_metadata.regex_patterns == ["a"]
+
+
+def test_role_add_and_remove():
+    entry = make_entry(
+        action_type=AuditLogAction.member_role_update.value,
+        changes=[
+            {"key": "$remove", "new_value": [{"id": "5", "name": "old"}]},
+            {"key": "$add", "new_value": [{"id": "4", "name": "new"}]},
+        ],
+    )
+    assert [r.id for r in entry.before.roles] == [5]
+    assert [r.id for r in entry.after.roles] == [4]
+
+
+def test_empty_ids():
+    entry = make_entry(
+        action_type=AuditLogAction.guild_update.value, user_id="", target_id=""
+    )
+    assert entry.user is None
+    assert entry._target_id is None
+
+
+def test_no_changes():
+    entry = make_entry(action_type=AuditLogAction.channel_delete.value)
+    assert len(entry.before) == 0
+    assert len(entry.after) == 0